@@ -0,0 +1,124 @@
+"""Compare CPU time of the list endpoints against the previous read path.
+
+Seeds a throwaway SQLite database with N stores and N audit events, then calls
+GET /stores and GET /audit-events through the real app and through legacy
+routes that rebuild validated pydantic models and go through response_model
+validation and the standard JSON encoder, as the API did before.
+
+Usage (from the repository root):
+    python scripts/bench_reads.py [--rows 10000] [--requests 20]
+"""
+import argparse
+import datetime
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    # The app's SQLite URL is relative to the working directory
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        return run(args)
+    finally:
+        os.chdir(previous_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+def run(args: argparse.Namespace) -> int:
+    os.environ["WARM_ADAPTERS"] = "false"
+    sys.path.insert(0, REPO_ROOT)
+
+    from typing import List
+    from fastapi import APIRouter, Depends
+    from fastapi.testclient import TestClient
+    from sqlalchemy import insert
+    from sqlalchemy.orm import Session
+
+    from src.backend.main import app
+    from src.backend.app.db import SessionLocal, get_db
+    from src.backend.app.domain.models import Store, StoreType, StoreStatus, AuditEvent, AuditAction
+    from src.backend.app.adapters.store_repository import StoreModel, AuditEventModel
+
+    legacy = APIRouter()
+
+    @legacy.get("/stores", response_model=List[Store])
+    def legacy_list_stores(db: Session = Depends(get_db)):
+        return [
+            Store(id=s.id, name=s.name, type=s.type, status=s.status,
+                  created_at=s.created_at, url=s.url, namespace=s.namespace)
+            for s in db.query(StoreModel).all()
+        ]
+
+    @legacy.get("/audit-events", response_model=List[AuditEvent])
+    def legacy_list_audit_events(limit: int = 50, db: Session = Depends(get_db)):
+        events = db.query(AuditEventModel).order_by(AuditEventModel.created_at.desc()).limit(limit).all()
+        return [
+            AuditEvent(id=e.id, store_id=e.store_id, store_name=e.store_name,
+                       action=e.action, message=e.message, created_at=e.created_at)
+            for e in events
+        ]
+
+    app.include_router(legacy, prefix="/legacy")
+
+    with TestClient(app) as client:
+        now = datetime.datetime.utcnow()
+        with SessionLocal() as db:
+            db.execute(insert(StoreModel), [{
+                "id": str(uuid.uuid4()),
+                "name": f"store-{i}",
+                "type": StoreType.WOOCOMMERCE if i % 2 else StoreType.MEDUSA,
+                "status": StoreStatus.READY,
+                "created_at": now - datetime.timedelta(seconds=i),
+                "url": f"http://store-{i}.127.0.0.1.nip.io",
+                "namespace": f"store-{i}-{i:08x}",
+            } for i in range(args.rows)])
+            db.execute(insert(AuditEventModel), [{
+                "id": str(uuid.uuid4()),
+                "store_id": str(uuid.uuid4()),
+                "store_name": f"store-{i}",
+                "action": AuditAction.PROVISION_READY,
+                "message": None,
+                "created_at": now - datetime.timedelta(seconds=i),
+            } for i in range(args.rows)])
+            db.commit()
+
+        paths = [
+            ("GET /stores", "/stores"),
+            ("GET /audit-events", f"/audit-events?limit={args.rows}"),
+        ]
+        failed = False
+        for label, path in paths:
+            fast = client.get(f"/api/v1{path}")
+            slow = client.get(f"/legacy{path}")
+            if json.loads(fast.content) != json.loads(slow.content):
+                print(f"{label}: response differs from the legacy path")
+                failed = True
+                continue
+
+            timings = {}
+            for name, prefix in (("legacy", "/legacy"), ("fast", "/api/v1")):
+                started = time.process_time()
+                for _ in range(args.requests):
+                    client.get(f"{prefix}{path}").raise_for_status()
+                timings[name] = (time.process_time() - started) / args.requests
+
+            print(f"{label} ({args.rows} rows): legacy {timings['legacy'] * 1000:.1f} ms CPU, "
+                  f"fast {timings['fast'] * 1000:.1f} ms CPU "
+                  f"({timings['legacy'] / timings['fast']:.1f}x)")
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
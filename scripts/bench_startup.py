@@ -0,0 +1,67 @@
+"""Measure backend cold start against a time budget.
+
+Each sample is a fresh interpreter that imports the app and runs its lifespan
+startup, which is what a newly scheduled API replica pays. The first sample
+bootstraps an empty database; the rest hit an already-migrated schema.
+
+Usage (from the repository root):
+    python scripts/bench_startup.py [--runs 10] [--budget 2.0]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import time
+started = time.perf_counter()
+import asyncio, json, sys
+from src.backend.main import app, lifespan
+
+async def boot():
+    async with lifespan(app):
+        pass
+
+asyncio.run(boot())
+print(json.dumps({
+    "seconds": time.perf_counter() - started,
+    "kubernetes_loaded": "kubernetes" in sys.modules,
+    "yaml_loaded": "yaml" in sys.modules,
+}))
+"""
+
+def sample(workdir: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, WARM_ADAPTERS="false")
+    out = subprocess.check_output([sys.executable, "-c", CHILD], cwd=workdir, env=env)
+    return json.loads(out.decode("utf-8").strip().splitlines()[-1])
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=float(os.getenv("STARTUP_BUDGET_SECONDS", "2.0")))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        first = sample(workdir)
+        warm = [sample(workdir) for _ in range(args.runs)]
+
+    seconds = [s["seconds"] for s in warm]
+    median = statistics.median(seconds)
+    print(f"empty database:   {first['seconds'] * 1000:.1f} ms")
+    print(f"migrated schema:  median {median * 1000:.1f} ms, max {max(seconds) * 1000:.1f} ms over {args.runs} runs")
+    print(f"kubernetes imported at startup: {any(s['kubernetes_loaded'] for s in warm)}")
+    print(f"yaml imported at startup:       {any(s['yaml_loaded'] for s in warm)}")
+    print(f"budget:           {args.budget * 1000:.1f} ms")
+
+    if median > args.budget:
+        print("FAIL: median startup is over budget")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
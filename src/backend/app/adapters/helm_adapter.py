@@ -1,5 +1,4 @@
 import subprocess
-import yaml
 import logging
 import os
 from typing import Dict, Any
@@ -23,6 +22,7 @@ class HelmAdapter:
         # Better to pass via --values <file>
         # For simplicity in this demo, we can dump to a tmp file.
         import tempfile
+        import yaml
         
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as tmp:
             yaml.dump(values, tmp)
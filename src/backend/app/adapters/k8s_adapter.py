@@ -1,26 +1,58 @@
-from kubernetes import client, config
-from kubernetes.client.rest import ApiException
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# The kubernetes package is slow to import, so it is only loaded (and the
+# cluster config resolved) on first use or when warm_up() is called.
 class K8sAdapter:
     def __init__(self):
-        try:
-            config.load_incluster_config()
-            logger.info("Loaded in-cluster config")
-        except config.ConfigException:
+        self._lock = threading.Lock()
+        self._core_v1 = None
+        self._apps_v1 = None
+        self._networking_v1 = None
+
+    def warm_up(self) -> None:
+        if self._core_v1 is not None:
+            return
+        with self._lock:
+            if self._core_v1 is not None:
+                return
+            from kubernetes import client, config
+
             try:
-                config.load_kube_config()
-                logger.info("Loaded kube-config")
+                config.load_incluster_config()
+                logger.info("Loaded in-cluster config")
             except config.ConfigException:
-                logger.warning("Could not load K8s config. usage might fail.")
+                try:
+                    config.load_kube_config()
+                    logger.info("Loaded kube-config")
+                except config.ConfigException:
+                    logger.warning("Could not load K8s config. usage might fail.")
+
+            self._apps_v1 = client.AppsV1Api()
+            self._networking_v1 = client.NetworkingV1Api()
+            # Assigned last: a non-None core_v1 means the adapter is fully initialised
+            self._core_v1 = client.CoreV1Api()
+
+    @property
+    def core_v1(self):
+        self.warm_up()
+        return self._core_v1
+
+    @property
+    def apps_v1(self):
+        self.warm_up()
+        return self._apps_v1
 
-        self.core_v1 = client.CoreV1Api()
-        self.apps_v1 = client.AppsV1Api()
-        self.networking_v1 = client.NetworkingV1Api()
+    @property
+    def networking_v1(self):
+        self.warm_up()
+        return self._networking_v1
 
     def create_namespace(self, name: str):
+        from kubernetes import client
+        from kubernetes.client.rest import ApiException
         try:
             self.core_v1.read_namespace(name)
             logger.info(f"Namespace {name} already exists")
@@ -33,6 +65,7 @@ class K8sAdapter:
                 raise e
 
     def delete_namespace(self, name: str):
+        from kubernetes.client.rest import ApiException
         try:
             self.core_v1.delete_namespace(name)
             logger.info(f"Deleted namespace {name}")
@@ -41,6 +74,7 @@ class K8sAdapter:
                 raise e
 
     def get_namespace_status(self, name: str) -> str:
+        from kubernetes.client.rest import ApiException
         try:
             ns = self.core_v1.read_namespace(name)
             return ns.status.phase
@@ -50,6 +84,7 @@ class K8sAdapter:
             raise e
 
     def list_secret_names(self, namespace: str, label_selector: str) -> list:
+        from kubernetes.client.rest import ApiException
         try:
             secrets = self.core_v1.list_namespaced_secret(namespace, label_selector=label_selector)
             return [item.metadata.name for item in secrets.items]
@@ -59,6 +94,7 @@ class K8sAdapter:
             raise e
 
     def get_secret_data(self, namespace: str, name: str) -> dict:
+        from kubernetes.client.rest import ApiException
         try:
             secret = self.core_v1.read_namespaced_secret(name=name, namespace=namespace)
             return secret.data or {}
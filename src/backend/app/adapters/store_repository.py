@@ -1,9 +1,9 @@
-from sqlalchemy import Column, String, DateTime, Enum
+from sqlalchemy import Column, String, DateTime, Enum, select
 from sqlalchemy.orm import Session
 from ..domain.models import Store, StoreType, StoreStatus, AuditEvent, AuditAction
 from ..domain.ports import StoreRepository
-from ..db import Base, engine
-from typing import List, Optional
+from ..db import Base
+from typing import Any, Dict, List, Optional
 import datetime
 
 class StoreModel(Base):
@@ -17,8 +17,9 @@ class StoreModel(Base):
     url = Column(String, nullable=True)
     namespace = Column(String)
 
+    # Rows come from our own database, so skip pydantic validation
     def to_domain(self) -> Store:
-        return Store(
+        return Store.model_construct(
             id=self.id,
             name=self.name,
             type=self.type,
@@ -51,7 +52,7 @@ class AuditEventModel(Base):
     created_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
 
     def to_domain(self) -> AuditEvent:
-        return AuditEvent(
+        return AuditEvent.model_construct(
             id=self.id,
             store_id=self.store_id,
             store_name=self.store_name,
@@ -71,8 +72,10 @@ class AuditEventModel(Base):
             created_at=event.created_at
         )
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Column projections for the read paths: exactly the fields the API models expose,
+# in the same order, so rows can be serialized without building ORM objects.
+_STORE_COLUMNS = [StoreModel.__table__.c[name] for name in Store.model_fields]
+_AUDIT_EVENT_COLUMNS = [AuditEventModel.__table__.c[name] for name in AuditEvent.model_fields]
 
 class SqlAlchemyStoreRepository(StoreRepository):
     def __init__(self, db: Session):
@@ -109,6 +112,10 @@ class SqlAlchemyStoreRepository(StoreRepository):
         db_stores = self.db.query(StoreModel).all()
         return [s.to_domain() for s in db_stores]
 
+    def list_rows(self) -> List[Dict[str, Any]]:
+        rows = self.db.execute(select(*_STORE_COLUMNS)).mappings()
+        return [dict(row) for row in rows]
+
     def delete(self, store_id: str) -> None:
         db_store = self.db.query(StoreModel).filter(StoreModel.id == store_id).first()
         if db_store:
@@ -130,3 +137,11 @@ class SqlAlchemyStoreRepository(StoreRepository):
             .all()
         )
         return [event.to_domain() for event in events]
+
+    def list_audit_event_rows(self, limit: int = 50) -> List[Dict[str, Any]]:
+        rows = self.db.execute(
+            select(*_AUDIT_EVENT_COLUMNS)
+            .order_by(AuditEventModel.created_at.desc())
+            .limit(limit)
+        ).mappings()
+        return [dict(row) for row in rows]
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
 from sqlalchemy.orm import Session
 from typing import List, Dict
+from functools import lru_cache
 import os
 import time
 
 from ..domain.models import Store, CreateStoreRequest, AdminCredentials, AuditEvent
 from ..db import get_db
+from .responses import ORJSONResponse
 from ..adapters.store_repository import SqlAlchemyStoreRepository
 from ..adapters.k8s_adapter import K8sAdapter
 from ..adapters.helm_adapter import HelmAdapter
@@ -29,11 +31,18 @@ def _check_rate_limit(request: Request) -> None:
     _rate_limit_state[client_ip] = timestamps
 
 # Dependency Injection
+# Adapters are stateless apart from their API clients, so one instance per process is shared.
+@lru_cache(maxsize=None)
+def get_k8s_adapter() -> K8sAdapter:
+    return K8sAdapter()
+
+@lru_cache(maxsize=None)
+def get_helm_adapter() -> HelmAdapter:
+    return HelmAdapter()
+
 def get_service(db: Session = Depends(get_db)) -> StoreService:
     repo = SqlAlchemyStoreRepository(db)
-    k8s = K8sAdapter()
-    helm = HelmAdapter()
-    return StoreService(repo, k8s, helm)
+    return StoreService(repo, get_k8s_adapter(), get_helm_adapter())
 
 @router.post("/stores", response_model=Store, status_code=202)
 def create_store(
@@ -52,9 +61,11 @@ def create_store(
     background_tasks.add_task(service.provision_store_task, store.id, "local") # default to local for now
     return store
 
-@router.get("/stores", response_model=List[Store])
+# Fast read path: rows come straight from our own DB, so returning the response
+# directly skips response_model re-validation (the model still documents the schema).
+@router.get("/stores", response_model=List[Store], response_class=ORJSONResponse)
 def list_stores(service: StoreService = Depends(get_service)):
-    return service.list_stores()
+    return ORJSONResponse(service.list_store_rows())
 
 @router.get("/stores/{store_id}", response_model=Store)
 def get_store(store_id: str, service: StoreService = Depends(get_service)):
@@ -83,6 +94,6 @@ def get_admin_credentials(store_id: str, service: StoreService = Depends(get_ser
         status_code = 404 if str(exc) == "Store not found" else 400
         raise HTTPException(status_code=status_code, detail=str(exc))
 
-@router.get("/audit-events", response_model=List[AuditEvent])
+@router.get("/audit-events", response_model=List[AuditEvent], response_class=ORJSONResponse)
 def list_audit_events(limit: int = 50, service: StoreService = Depends(get_service)):
-    return service.list_audit_events(limit)
+    return ORJSONResponse(service.list_audit_event_rows(limit))
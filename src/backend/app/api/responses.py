@@ -0,0 +1,12 @@
+from fastapi.responses import JSONResponse
+from typing import Any
+import orjson
+
+# orjson handles datetimes and str-based enums natively, so repository rows can be
+# rendered as-is. Used by list endpoints that return plain dicts and bypass
+# response_model validation.
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
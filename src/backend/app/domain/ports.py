@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from .models import Store, AuditEvent
 
 class StoreRepository(ABC):
@@ -19,6 +19,11 @@ class StoreRepository(ABC):
     def list(self) -> List[Store]:
         pass
 
+    # Plain dicts keyed by Store field names, for read paths that skip model construction
+    @abstractmethod
+    def list_rows(self) -> List[Dict[str, Any]]:
+        pass
+
     @abstractmethod
     def delete(self, store_id: str) -> None:
         pass
@@ -31,6 +36,10 @@ class StoreRepository(ABC):
     def list_audit_events(self, limit: int = 50) -> List[AuditEvent]:
         pass
 
+    @abstractmethod
+    def list_audit_event_rows(self, limit: int = 50) -> List[Dict[str, Any]]:
+        pass
+
 class Provisioner(ABC):
     @abstractmethod
     def provision(self, store: Store) -> None:
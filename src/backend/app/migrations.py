@@ -0,0 +1,60 @@
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, func, inspect, select
+from sqlalchemy.engine import Connection, Engine
+from typing import Callable, List, Tuple
+import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Kept on its own metadata so Base.metadata only describes the domain tables.
+_migration_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    _migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+def _create_store_tables(conn: Connection) -> None:
+    # checkfirst keeps this safe for databases bootstrapped before versioning existed
+    from .adapters.store_repository import StoreModel, AuditEventModel
+    from .db import Base
+    Base.metadata.create_all(
+        bind=conn,
+        tables=[StoreModel.__table__, AuditEventModel.__table__],
+        checkfirst=True,
+    )
+
+# Append-only: never edit or reorder an entry once it has shipped.
+MIGRATIONS: List[Tuple[int, Callable[[Connection], None]]] = [
+    (1, _create_store_tables),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+def current_version(conn: Connection) -> int:
+    if not inspect(conn).has_table(schema_migrations.name):
+        return 0
+    return conn.execute(select(func.max(schema_migrations.c.version))).scalar() or 0
+
+# Returns the number of migrations applied; 0 means the schema was already current.
+def run_migrations(engine: Engine) -> int:
+    with engine.begin() as conn:
+        version = current_version(conn)
+        if version >= LATEST_VERSION:
+            return 0
+
+        _migration_metadata.create_all(bind=conn, checkfirst=True)
+        applied = 0
+        for migration_version, migrate in MIGRATIONS:
+            if migration_version <= version:
+                continue
+            logger.info(f"Applying schema migration {migration_version}")
+            migrate(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=migration_version,
+                applied_at=datetime.datetime.utcnow()
+            ))
+            applied += 1
+        return applied
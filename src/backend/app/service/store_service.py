@@ -181,6 +181,9 @@ class StoreService:
     def list_stores(self) -> List[Store]:
         return self.repo.list()
 
+    def list_store_rows(self) -> List[Dict[str, Any]]:
+        return self.repo.list_rows()
+
     def delete_store(self, store_id: str):
         store = self.repo.get(store_id)
         if not store:
@@ -206,3 +209,6 @@ class StoreService:
 
     def list_audit_events(self, limit: int = 50) -> List[AuditEvent]:
         return self.repo.list_audit_events(limit)
+
+    def list_audit_event_rows(self, limit: int = 50) -> List[Dict[str, Any]]:
+        return self.repo.list_audit_event_rows(limit)
@@ -1,12 +1,46 @@
+import time
+
+_import_started = time.perf_counter()
+
+from contextlib import asynccontextmanager
+import logging
+import os
+import threading
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .app.api.endpoints import router
-from .app.db import Base, engine
+from .app.api.endpoints import router, get_k8s_adapter
+from .app.db import engine
+from .app.migrations import run_migrations
+
+logger = logging.getLogger(__name__)
+
+def _warm_adapters() -> None:
+    try:
+        get_k8s_adapter().warm_up()
+    except Exception as e:
+        logger.warning(f"Adapter warm-up failed: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema bootstrap is a single version lookup once migrations have been applied
+    applied = run_migrations(engine)
+    if applied:
+        logger.info(f"Applied {applied} schema migration(s)")
+
+    # Warm the Kubernetes client off the startup path so replicas can serve reads immediately
+    if os.getenv("WARM_ADAPTERS", "true").lower() == "true":
+        threading.Thread(target=_warm_adapters, name="adapter-warm-up", daemon=True).start()
 
-# Create tables on startup
-Base.metadata.create_all(bind=engine)
+    startup_seconds = time.perf_counter() - _import_started
+    budget_seconds = float(os.getenv("STARTUP_BUDGET_SECONDS", "2.0"))
+    if startup_seconds > budget_seconds:
+        logger.warning(f"Startup took {startup_seconds:.3f}s, over the {budget_seconds:.3f}s budget")
+    else:
+        logger.info(f"Startup took {startup_seconds:.3f}s")
+    yield
 
-app = FastAPI(title="Store Orchestrator", version="1.0.0")
+app = FastAPI(title="Store Orchestrator", version="1.0.0", lifespan=lifespan)
 
 # CORS
 app.add_middleware(